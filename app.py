@@ -1,8 +1,14 @@
+import io
+import os
+from collections import namedtuple
+from types import MappingProxyType
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from wordcloud import WordCloud
-from collections import Counter
+import plotly.graph_objects as go
+from wordcloud import STOPWORDS, WordCloud
 import matplotlib.pyplot as plt
 
 # --- Page Configuration ---
@@ -14,127 +20,154 @@ st.set_page_config(
 )
 
 # --- Custom Styling ---
-# Inject CSS for a cleaner, more professional UI
-st.markdown(
-    """
-<style>
-    /* Main app background - simplified */
-    .main {
-        background-color: #f8f9fa;
-        padding: 10px;
-    }
-    
-    /* Sidebar styling - simplified */
-    .css-1d391kg {
-        background-color: #2c3e50;
-        border-right: 2px solid #3498db;
-    }
-    
-    /* KPI Metric styling - simplified */
-    div[data-testid="metric-container"] {
-        background-color: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 10px;
-        padding: 20px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        margin: 10px 0;
-    }
-    
-    /* Insight box styling - simplified */
-    .insight-box {
-        background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%);
-        border: none;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        color: white;
-        font-weight: 500;
-    }
-    
-    .trend-highlight {
-        background: linear-gradient(135deg, #fdcb6e 0%, #e17055 100%);
-        border: none;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        color: white;
-        font-weight: 500;
-    }
-    
-    .success-box {
-        background: linear-gradient(135deg, #00b894 0%, #00a085 100%);
-        border: none;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        color: white;
-        font-weight: 500;
-    }
-    
-    .warning-box {
-        background: linear-gradient(135deg, #fdcb6e 0%, #e17055 100%);
-        border: none;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        color: white;
-        font-weight: 500;
-    }
-    
-    /* Button styling - simplified */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border: none;
-        border-radius: 20px;
-        padding: 8px 20px;
-        color: white;
-        font-weight: 600;
-    }
-    
-    /* Tab styling - simplified */
-    .stTabs [data-baseweb="tab"] {
-        background-color: #f0f2f6;
-        border-radius: 8px;
-        padding: 8px 16px;
-        color: #2c3e50;
-        font-weight: 500;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    /* Text styling */
-    h1, h2, h3 {
-        color: #2c3e50;
-        font-weight: 600;
-    }
-    
-    /* Sidebar text */
-    .css-1d391kg h1, .css-1d391kg h2, .css-1d391kg h3 {
-        color: white;
-    }
-    
-    /* Chart containers - simplified */
-    .stPlotlyChart {
-        background-color: white;
-        border-radius: 10px;
-        padding: 15px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        margin: 10px 0;
-    }
-</style>""",
-    unsafe_allow_html=True,
-)
+# The stylesheet lives in static/style.css; read it once per process and
+# inject it on each rerun without rebuilding the string
+@st.cache_resource
+def get_css():
+    """Read the dashboard stylesheet once per process."""
+    with open(os.path.join("static", "style.css")) as f:
+        return f.read()
+
+
+st.markdown(f"<style>{get_css()}</style>", unsafe_allow_html=True)
 
 
 # --- Data Loading & Caching ---
-@st.cache_data
+DATA_FILE = "survey.csv"
+# Optional typed artifacts produced by tools/make_parquet.py; when present
+# the loader skips all cleaning and just reads them back
+PARQUET_FILE = "survey.parquet"
+CUBE_FILE = "cube.parquet"
+STRATEGIES_FILE = "strategies_long.parquet"
+
+# Columns the dashboard reads at runtime, passed to the Parquet reader so
+# the column selection happens inside pyarrow instead of after a full read.
+# The raw strategy and tech-relationship text stays on disk only: the app
+# consumes the strategies_long table and the precomputed _tech_tokens
+PARQUET_COLUMNS = [
+    "Age Group",
+    "Occupation",
+    "Screen TIme",
+    "Platforms used",
+    "Focus Duration",
+    "Attention Rating",
+    "Distraction Rating",
+    "Digital Guilt",
+    "Emotional Impact",
+    "_tech_tokens",
+]
+CUBE_COLUMNS = ["n", "att_sum", "dist_sum"]
+STRATEGY_COLUMNS = ["Cleaned Strategies", "Strategy Affectiveness"]
+
+# Only these columns are referenced by the dashboard; everything else in the
+# CSV is dead weight for the per-rerun masks
+USECOLS = [
+    "Age Group",
+    "Occupation",
+    "Screen TIme",
+    "Platforms used",
+    "Focus Duration",
+    "Attention Rating",
+    "Distraction Rating",
+    "Digital Guilt",
+    "Emotional Impact",
+    "Cleaned Strategies",
+    "Strategy Affectiveness",
+    "Tech Relationship",
+]
+
+# Canonical ordering of the screen-time buckets
+SCREEN_TIME_ORDER = [
+    "Less than 3 hours",
+    "3–5 hours",
+    "6–8 hours",
+    "9+ hours",
+]
+
+# Ordinal encoding of the buckets, used for the summary correlations.
+# Derived from SCREEN_TIME_ORDER so there is one source of truth, and
+# wrapped read-only so no consumer can mutate the shared mapping
+SCREEN_TIME_MAP = MappingProxyType(
+    {bucket: rank for rank, bucket in enumerate(SCREEN_TIME_ORDER, start=1)}
+)
+
+# Focus-balance verdicts for the Summary tab, ordered worst to best so the
+# attention/distraction ratio picks one by clamped index instead of an
+# if/elif chain
+FOCUS_BALANCE_INSIGHTS = (
+    "Focus challenge: Distraction rating exceeds attention rating, indicating significant digital wellness concerns.",
+    "Moderate focus challenge: Attention and distraction are closely balanced, suggesting room for improvement.",
+    "Positive focus balance: Attention rating exceeds distraction rating, indicating good digital wellness.",
+)
+
+# Recommendation blocks for the Summary tab. Kept flush-left: the blocks
+# are joined into a single st.markdown emit, which only dedents by the
+# common margin, so any per-block indentation would survive into the
+# rendered output and break the bullet lists
+HIGH_DISTRACTION_TIPS = """
+**For High Distraction Groups:**
+- Implement app timers and screen time limits
+- Try Pomodoro technique for focused work sessions
+- Consider digital detox periods
+- Use Do Not Disturb mode during important tasks
+"""
+
+LOW_ATTENTION_TIPS = """
+**For Low Attention Groups:**
+- Practice mindfulness and meditation
+- Create distraction-free work environments
+- Set clear goals and time boundaries
+- Use focus-enhancing tools and techniques
+"""
+
+GENERAL_WELLNESS_TIPS = """
+**General Digital Wellness Tips:**
+- Take regular breaks from screens
+- Set specific times for checking social media
+- Use technology intentionally rather than habitually
+- Balance online and offline activities
+- Monitor and reflect on digital habits regularly
+"""
+
+# Below this many matching rows the Summary-tab correlations and modal
+# answers are noise; compute_insights short-circuits instead of running
+# its pandas pipeline on a handful of rows
+MIN_INSIGHT_ROWS = 10
+
+# Free-text artifacts to drop from the exploded strategy table
+UNWANTED_STRATEGIES = [
+    "Na",
+    "which is often on-screen",
+    "recenter on chosen task",
+]
+
+
+# persist="disk" keeps the cleaned frames across process restarts, so a cold
+# start skips the CSV parse and cube/strategy construction entirely
+@st.cache_data(persist="disk", show_spinner=False)
 def load_and_clean_data(file_path):
-    """Loads and preprocesses the survey data, cached for performance."""
+    """Loads and preprocesses the survey data, cached for performance.
+
+    Returns the cleaned DataFrame together with a small pre-aggregated cube
+    (respondent count and rating sums per Age Group / Occupation / Screen Time
+    combination) so per-filter KPIs can be answered by slicing the cube
+    instead of re-scanning the raw rows, plus a normalized long-format
+    strategy table so the split/explode/strip work happens once at load time.
+    """
     try:
-        df = pd.read_csv(file_path)
+        # Prefer the canonicalized Parquet artifacts (see
+        # tools/make_parquet.py): every cleaning step already ran in the
+        # build, so loading is three plain reads with no pandas work
+        if os.path.exists(PARQUET_FILE):
+            return (
+                pd.read_parquet(PARQUET_FILE, columns=PARQUET_COLUMNS),
+                pd.read_parquet(CUBE_FILE, columns=CUBE_COLUMNS),
+                pd.read_parquet(STRATEGIES_FILE, columns=STRATEGY_COLUMNS),
+            )
+
+        # The raw CSV headers carry stray whitespace, so match on the
+        # stripped name when selecting columns
+        df = pd.read_csv(file_path, usecols=lambda c: c.strip() in USECOLS)
         # Clean column names by stripping leading/trailing whitespace
         df.columns = df.columns.str.strip()
 
@@ -147,19 +180,273 @@ def load_and_clean_data(file_path):
         }
         df["Occupation"] = df["Occupation"].replace(occupation_mapping)
 
-        return df
+        # Store the filter columns as Categorical so isin/groupby/value_counts
+        # compare small integer codes instead of hashing strings on every rerun
+        for col in ["Age Group", "Occupation", "Screen TIme", "Focus Duration"]:
+            df[col] = df[col].astype("category")
+
+        # Downcast the rating columns (1-5 scales) so masks and reductions
+        # move a fraction of the bytes
+        for col in ["Attention Rating", "Distraction Rating"]:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        df["Strategy Affectiveness"] = pd.to_numeric(
+            df["Strategy Affectiveness"], downcast="float"
+        )
+
+        cube = df.groupby(
+            ["Age Group", "Occupation", "Screen TIme"], observed=True
+        ).agg(
+            n=("Attention Rating", "size"),
+            att_sum=("Attention Rating", "sum"),
+            dist_sum=("Distraction Rating", "sum"),
+        )
+
+        # Normalize the multi-select strategy column once: one row per
+        # (respondent, strategy), indexed like df so it can be sliced by the
+        # same filter mask without any per-rerun string work
+        strategy_col = "Cleaned Strategies"
+        effectiveness_col = "Strategy Affectiveness"
+        strategies_long = df[[strategy_col, effectiveness_col]].dropna()
+        try:
+            # Arrow-backed strings run the split/strip below as vectorized
+            # kernels over contiguous UTF-8 buffers instead of per-cell
+            # Python calls; fall back to object dtype without pyarrow
+            strategies_long[strategy_col] = strategies_long[strategy_col].astype(
+                "string[pyarrow]"
+            )
+        except ImportError:
+            pass
+        # Splitting on the commas together with their surrounding whitespace
+        # replaces the old post-explode strip; the remaining strip for edge
+        # whitespace runs before the explode, over the smaller array
+        strategies_long = strategies_long.assign(
+            **{
+                strategy_col: strategies_long[strategy_col]
+                .str.strip()
+                .str.split(r"\s*,\s*", regex=True)
+            }
+        ).explode(strategy_col)
+        strategies_long = strategies_long[
+            ~strategies_long[strategy_col].isin(UNWANTED_STRATEGIES)
+        ]
+        strategies_long = strategies_long[
+            strategies_long[strategy_col].str.len() < 35
+        ]
+        # Categorical codes let the per-filter aggregation skip string hashing
+        strategies_long[strategy_col] = strategies_long[strategy_col].astype(
+            "category"
+        )
+
+        # Tokenize the free-text tech-relationship answers once, so the word
+        # cloud only has to sum token counts per filter selection
+        df["_tech_tokens"] = (
+            df["Tech Relationship"].fillna("").str.lower().str.findall(r"[a-z']{3,}")
+        )
+
+        return df, cube, strategies_long
     except FileNotFoundError:
         return None
 
 
+# --- Cached Per-Filter Aggregations ---
+# Each helper is keyed on the (ages, occupations) selection tuples so that
+# reruns triggered by tab switches or chart-view toggles reuse the cached
+# result instead of re-scanning the DataFrame.
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_filtered(ages, occs):
+    """Return the rows matching the selected age groups and occupations."""
+    df, _, _ = load_and_clean_data(DATA_FILE)
+    # One combined boolean pass (int8 category-code compares); the result is
+    # cached per selection so this runs once, not once per consumer
+    mask = (
+        df["Age Group"].isin(ages).to_numpy()
+        & df["Occupation"].isin(occs).to_numpy()
+    )
+    return df.iloc[mask.nonzero()[0]]
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_cube_slice(ages, occs):
+    """Slice the pre-aggregated cube down to the selected demographics."""
+    _, cube, _ = load_and_clean_data(DATA_FILE)
+    return cube[
+        cube.index.get_level_values("Age Group").isin(ages)
+        & cube.index.get_level_values("Occupation").isin(occs)
+    ]
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_platform_counts(ages, occs):
+    """Count how often each platform appears in the multi-select column."""
+    filtered_df = compute_filtered(ages, occs)
+    counts = filtered_df["Platforms used"].dropna().str.get_dummies(sep=", ").sum()
+    # Merge entries that only differ by surrounding whitespace
+    counts = counts.groupby(counts.index.str.strip()).sum()
+    return counts.to_dict()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_strategy_frame(ages, occs):
+    """Slice the precomputed strategy long table down to the filtered rows."""
+    _, _, strategies_long = load_and_clean_data(DATA_FILE)
+    filtered_df = compute_filtered(ages, occs)
+    return strategies_long[strategies_long.index.isin(filtered_df.index)]
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_strategy_stats(ages, occs):
+    """Mean effectiveness and mention count per cleaned strategy."""
+    _, _, strategies_long = load_and_clean_data(DATA_FILE)
+    filtered_df = compute_filtered(ages, occs)
+    # Fused slice + aggregate: mask the flat code/value arrays and feed them
+    # straight into the kernel, with no intermediate sliced DataFrame
+    row_mask = strategies_long.index.isin(filtered_df.index)
+    if not row_mask.any():
+        return pd.DataFrame(columns=["Cleaned Strategies", "mean", "count"])
+    cat = strategies_long["Cleaned Strategies"].cat
+    means, counts = group_mean(
+        cat.codes.to_numpy()[row_mask],
+        strategies_long["Strategy Affectiveness"].to_numpy()[row_mask],
+        len(cat.categories),
+    )
+    present = counts > 0
+    return pd.DataFrame(
+        {
+            "Cleaned Strategies": cat.categories[present],
+            "mean": means[present],
+            "count": counts[present],
+        }
+    )
+
+
+def group_mean(codes, values, n_groups):
+    """Mean of `values` per integer group code, via two NumPy reductions.
+
+    Replaces a pandas groupby-mean on short string keys with bincount over
+    contiguous arrays: no hashing per exploded row, and unlike np.add.at
+    the scatter-add runs in a single fused C loop.
+    """
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    counts = np.bincount(codes, minlength=n_groups)
+    return sums / np.maximum(counts, 1), counts
+
+
+@st.cache_data(show_spinner=False)
+def get_filter_options():
+    """Sorted sidebar filter choices, computed once from the category sets."""
+    df, _, _ = load_and_clean_data(DATA_FILE)
+    return (
+        sorted(df["Age Group"].cat.categories.tolist()),
+        sorted(df["Occupation"].cat.categories.tolist()),
+    )
+
+
+def category_counts(cat_series):
+    """Counts per category, via np.unique over the integer codes.
+
+    Equivalent to value_counts on a Categorical column but stays in NumPy:
+    a sort-reduce over int8 codes with no hashing or Series bookkeeping.
+    """
+    codes = cat_series.cat.codes.to_numpy()
+    u, c = np.unique(codes[codes >= 0], return_counts=True)
+    cats = cat_series.cat.categories.to_numpy()
+    return pd.Series(c, index=cats[u]).sort_values(ascending=False)
+
+
+# Per-filter summary statistics shared by the KPI header and every tab
+Stats = namedtuple(
+    "Stats",
+    ["n", "att_mean", "dist_mean", "age_counts", "occ_counts", "screen_counts", "focus_counts"],
+)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def summarize(ages, occs):
+    """Compute the shared per-filter stats in one pass over the cube."""
+    cube_slice = compute_cube_slice(ages, occs)
+    # One fused reduction over all three cube columns instead of three
+    # separate column sums
+    totals = cube_slice[["n", "att_sum", "dist_sum"]].to_numpy().sum(axis=0)
+    n = int(totals[0])
+    att_mean = totals[1] / n if n else 0.0
+    dist_mean = totals[2] / n if n else 0.0
+
+    def level_counts(level):
+        return (
+            cube_slice.groupby(level=level, observed=True)["n"]
+            .sum()
+            .sort_values(ascending=False)
+        )
+
+    # Focus Duration is not part of the cube, so count it from the rows
+    focus_counts = category_counts(compute_filtered(ages, occs)["Focus Duration"])
+
+    return Stats(
+        n,
+        att_mean,
+        dist_mean,
+        level_counts("Age Group"),
+        level_counts("Occupation"),
+        level_counts("Screen TIme"),
+        focus_counts,
+    )
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_screen_time_stats(ages, occs):
+    """Mean and respondent count of Distraction Rating per screen-time bucket."""
+    sub = (
+        compute_cube_slice(ages, occs)
+        .groupby(level="Screen TIme", observed=True)[["n", "dist_sum"]]
+        .sum()
+    )
+    return pd.DataFrame({"mean": sub["dist_sum"] / sub["n"], "count": sub["n"]})
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_tech_freqs(ages, occs):
+    """Word frequencies of the tech-relationship answers for the selection."""
+    filtered_df = compute_filtered(ages, occs)
+    tokens = filtered_df["_tech_tokens"].explode().dropna()
+    tokens = tokens[~tokens.isin(STOPWORDS)]
+    return tokens.value_counts().to_dict()
+
+
+@st.cache_resource
+def get_wordcloud_engine():
+    """Shared WordCloud instance; the configuration never changes."""
+    return WordCloud(
+        width=1200,
+        height=600,
+        background_color="#FFFFFF",
+        colormap="plasma",
+        collocations=False,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_wordcloud(freqs):
+    """Render the word cloud to PNG bytes, cached on the frequency dict."""
+    wordcloud = get_wordcloud_engine().generate_from_frequencies(freqs)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.imshow(wordcloud, interpolation="bilinear")
+    ax.axis("off")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    # Close the figure so reruns don't accumulate in pyplot's registry
+    plt.close(fig)
+    return buf.getvalue()
+
+
 # --- Helper Functions for Insights ---
-def get_attention_insight(filtered_df):
+def get_attention_insight(stats):
     """Generate insights about attention patterns"""
-    if filtered_df.empty:
+    if stats.n == 0:
         return "No data available for selected filters."
-    
-    avg_attention = filtered_df["Attention Rating"].mean()
-    
+
+    avg_attention = stats.att_mean
+
     if avg_attention >= 4:
         return f"High average attention rating: {avg_attention:.1f}/5."
     elif avg_attention >= 3:
@@ -168,13 +455,13 @@ def get_attention_insight(filtered_df):
         return f"Low average attention rating: {avg_attention:.1f}/5. Consider exploring coping strategies."
 
 
-def get_distraction_insight(filtered_df):
+def get_distraction_insight(stats):
     """Generate insights about distraction patterns"""
-    if filtered_df.empty:
+    if stats.n == 0:
         return "No data available for selected filters."
-    
-    avg_distraction = filtered_df["Distraction Rating"].mean()
-    
+
+    avg_distraction = stats.dist_mean
+
     if avg_distraction <= 2:
         return f"Low distraction: {avg_distraction:.1f}/5."
     elif avg_distraction <= 3:
@@ -183,15 +470,14 @@ def get_distraction_insight(filtered_df):
         return f"High distraction: {avg_distraction:.1f}/5."
 
 
-def get_screen_time_insight(filtered_df):
+def get_screen_time_insight(stats):
     """Generate insights about screen time patterns"""
-    if filtered_df.empty:
+    if stats.n == 0:
         return "No data available for selected filters."
-    
-    screen_time_dist = filtered_df["Screen TIme"].value_counts()
-    most_common = screen_time_dist.idxmax()
-    count = screen_time_dist.max()
-    
+
+    most_common = stats.screen_counts.idxmax()
+    count = stats.screen_counts.max()
+
     return f"Most common screen time: {most_common} ({count} respondents)"
 
 
@@ -204,27 +490,411 @@ def get_platform_insight(platform_counts):
     return f"Most popular platform: {top_platform[0]} ({top_platform[1]} users)"
 
 
-def get_strategy_insight(strategy_data):
+def get_strategy_insight(strategy_stats):
     """Generate insights about coping strategies"""
-    if strategy_data.empty:
+    if strategy_stats.empty:
         return "No strategy data available."
-    
-    avg_effectiveness = strategy_data["Strategy Affectiveness"].mean()
-    most_effective = strategy_data.groupby("Cleaned Strategies")["Strategy Affectiveness"].mean().idxmax()
-    
+
+    # Overall mean across all strategy mentions, recovered from the per-group
+    # sums so no extra pass over the exploded rows is needed
+    avg_effectiveness = (
+        strategy_stats["mean"] * strategy_stats["count"]
+    ).sum() / strategy_stats["count"].sum()
+    most_effective = strategy_stats.loc[
+        strategy_stats["mean"].idxmax(), "Cleaned Strategies"
+    ]
+
     return f"Average effectiveness is {avg_effectiveness:.1f}/5. '{most_effective}' is rated most effective."
 
 
+# Derived values behind the Summary tab's insight blocks
+Insights = namedtuple(
+    "Insights",
+    [
+        "corr_distraction",
+        "corr_attention",
+        "high_screen_distraction",
+        "top_guilt",
+        "top_impact",
+        "best_strategy",
+        "best_rating",
+    ],
+)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_insights(ages, occs):
+    """Correlations and modal answers shown in the Summary tab."""
+    filtered_df = compute_filtered(ages, occs)
+
+    # Tiny slices produce meaningless correlations and modes; bail out before
+    # any of the per-insight work runs, leaving every field None so the
+    # Summary tab's existing guards suppress the blocks
+    if len(filtered_df) < MIN_INSIGHT_ROWS:
+        return Insights(None, None, None, None, None, None, None)
+
+    # Materialize the rating columns once up front; the insights below share
+    # these arrays instead of repeating the pandas column lookups
+    d_arr = filtered_df["Distraction Rating"].to_numpy()
+    a_arr = filtered_df["Attention Rating"].to_numpy()
+
+    # Encode screen time as ordinal for simple correlation. Categorical codes
+    # give int8 ordinals in one C-level lookup; unknown buckets come back as
+    # -1, replacing the separate isin filter
+    codes = pd.Categorical(
+        filtered_df["Screen TIme"], categories=list(SCREEN_TIME_MAP), ordered=True
+    ).codes
+    mask = codes >= 0
+    screen_arr = codes[mask].astype(np.float64) + 1.0
+
+    corr_distraction = None
+    corr_attention = None
+    # The correlation is undefined for fewer than two rows or a single
+    # screen-time bucket; check that up front rather than letting pandas
+    # raise and swallowing the exception
+    if screen_arr.size >= 2 and screen_arr.std() > 0:
+        # One pairwise pass over the three arrays yields both correlations
+        # against the shared screen-time ordinal
+        with np.errstate(invalid="ignore", divide="ignore"):
+            c = np.corrcoef(np.vstack((screen_arr, d_arr[mask], a_arr[mask])))
+        corr_distraction = c[0, 1]
+        corr_attention = c[0, 2]
+
+    # Reuse the ordinal codes from the correlation step: "9+ hours" is the
+    # last bucket, so one integer compare replaces the string-equality scan
+    high_mask = codes == len(SCREEN_TIME_MAP) - 1
+    high_screen_distraction = d_arr[high_mask].mean() if high_mask.any() else None
+
+    # mode() stays in C; no dict materialization or Python-level max loop
+    top_guilt = filtered_df["Digital Guilt"].mode(dropna=True)
+    top_guilt = top_guilt.iat[0] if len(top_guilt) else None
+    top_impact = filtered_df["Emotional Impact"].mode(dropna=True)
+    top_impact = top_impact.iat[0] if len(top_impact) else None
+
+    # The split/explode/group-mean already ran once at load time; read the
+    # per-strategy table instead of rebuilding it from the raw column
+    best_strategy = None
+    best_rating = None
+    strategy_stats = compute_strategy_stats(ages, occs)
+    if not strategy_stats.empty:
+        best_row = strategy_stats.loc[strategy_stats["mean"].idxmax()]
+        best_strategy = best_row["Cleaned Strategies"]
+        best_rating = best_row["mean"]
+
+    return Insights(
+        corr_distraction,
+        corr_attention,
+        high_screen_distraction,
+        top_guilt,
+        top_impact,
+        best_strategy,
+        best_rating,
+    )
+
+
+def box_summary(values):
+    """Five-number summary (Tukey fences) for a precomputed go.Box trace."""
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    lower = values[values >= q1 - 1.5 * iqr].min()
+    upper = values[values <= q3 + 1.5 * iqr].max()
+    return q1, median, q3, lower, upper
+
+
+# --- Cached Figure Builders ---
+# st.tabs renders every tab body on each rerun, so each chart is built in a
+# cached function keyed on the filter selection (and view toggle where
+# relevant); hidden tabs then cost a cache lookup instead of a Plotly build.
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_age_pie(ages, occs):
+    """Age-group distribution pie for the Demographics tab."""
+    age_counts = summarize(ages, occs).age_counts
+    # go.Pie on the ready-made arrays skips Plotly Express's DataFrame
+    # introspection; the counts are already aggregated
+    fig_age = go.Figure(
+        go.Pie(
+            labels=age_counts.index.to_numpy(),
+            values=age_counts.to_numpy(),
+            hovertemplate="<b>Age Group:</b> %{label}<br><b>Respondents:</b> %{value}<br><b>Percentage:</b> %{percent}<extra></extra>",
+            textinfo='label+percent',
+            textfont_size=12,
+            marker=dict(
+                colors=px.colors.qualitative.Set3,
+                line=dict(color='white', width=2),
+            ),
+        )
+    )
+    fig_age.update_layout(
+        title="Age Group Distribution",
+        showlegend=False,
+        title_font_size=18,
+        title_font_color="#2c3e50",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+    return fig_age
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_occupation_bar(ages, occs):
+    """Occupation distribution bar chart for the Demographics tab."""
+    occupation_counts = summarize(ages, occs).occ_counts
+    fig_occ = go.Figure(
+        go.Bar(
+            x=occupation_counts.to_numpy(),
+            y=occupation_counts.index.to_numpy(),
+            orientation="h",
+            marker=dict(
+                color=occupation_counts.to_numpy(),
+                colorscale="Blues",
+                reversescale=True,
+            ),
+        )
+    )
+    fig_occ.update_layout(
+        title="Occupation Distribution",
+        xaxis_title="Number of Respondents",
+        yaxis={"categoryorder": "total ascending"},
+    )
+    return fig_occ
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_platform_fig(ages, occs):
+    """Horizontal bar chart of platform usage for the Digital Habits tab."""
+    platform_counts = compute_platform_counts(ages, occs)
+    platform_df = pd.DataFrame(
+        platform_counts.items(), columns=["Platform", "Count"]
+    ).sort_values("Count", ascending=True)
+    platform_df = platform_df[
+        ~platform_df["Platform"].str.contains("etc.", na=False)
+    ]
+
+    fig_plat = go.Figure(
+        go.Bar(
+            x=platform_df["Count"].to_numpy(),
+            y=platform_df["Platform"].to_numpy(),
+            orientation="h",
+            marker=dict(
+                color=platform_df["Count"].to_numpy(),
+                colorscale="Tealgrn",
+                reversescale=True,
+            ),
+        )
+    )
+    fig_plat.update_layout(
+        title="Most Commonly Used Digital Platforms",
+        xaxis_title="Count",
+        yaxis_title=None,
+    )
+    return fig_plat
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_screen_time_fig(ages, occs, view_type):
+    """Distraction-by-screen-time chart in either average or box-plot view."""
+    if view_type == "Average (easier)":
+        screen_time_stats = compute_screen_time_stats(ages, occs).reindex(
+            SCREEN_TIME_ORDER
+        )
+        avg_df = (
+            pd.DataFrame({"Screen TIme": screen_time_stats.index, "Avg Distraction": screen_time_stats["mean"].values, "N": screen_time_stats["count"].values})
+            .dropna()
+        )
+        avg = avg_df["Avg Distraction"].to_numpy()
+        fig_dist = go.Figure(
+            go.Bar(
+                x=avg_df["Screen TIme"].to_numpy(),
+                y=avg,
+                text=np.round(avg, 2),
+                textposition="outside",
+                marker=dict(color=avg, colorscale="OrRd"),
+                customdata=avg_df[["N"]].to_numpy(),
+                hovertemplate="<b>%{x}</b><br>Avg: %{y:.2f} / 5<br>N: %{customdata[0]}<extra></extra>",
+            )
+        )
+        fig_dist.update_layout(
+            title="Average Distraction Rating by Daily Screen Time",
+            xaxis=dict(
+                title="Screen Time",
+                categoryorder="array",
+                categoryarray=SCREEN_TIME_ORDER,
+            ),
+            yaxis=dict(title="Average Distraction (1-5)", range=[0, 5]),
+        )
+    else:
+        # Send only the five-number summary per bucket to the browser
+        # instead of serializing every survey row into the figure JSON
+        filtered_df = compute_filtered(ages, occs)
+        # Encode the buckets once; each per-bucket mask is then a single
+        # int8 compare on the codes array instead of a string-equality scan
+        # plus .loc slice per bucket
+        codes = pd.Categorical(
+            filtered_df["Screen TIme"], categories=SCREEN_TIME_ORDER, ordered=True
+        ).codes
+        d_arr = filtered_df["Distraction Rating"].to_numpy()
+        summaries = []
+        for code, bucket in enumerate(SCREEN_TIME_ORDER):
+            vals = d_arr[codes == code]
+            if len(vals):
+                summaries.append((bucket, *box_summary(vals)))
+        buckets, q1s, medians, q3s, lowers, uppers = zip(*summaries)
+        fig_dist = go.Figure(
+            go.Box(
+                x=buckets,
+                q1=q1s,
+                median=medians,
+                q3=q3s,
+                lowerfence=lowers,
+                upperfence=uppers,
+                marker_color="#FF6347",
+            )
+        )
+        fig_dist.update_layout(
+            title="Self-Rated Distraction by Daily Screen Time",
+            xaxis=dict(
+                title="Screen Time",
+                categoryorder="array",
+                categoryarray=SCREEN_TIME_ORDER,
+            ),
+            yaxis_title="Distraction Rating (1-5)",
+            showlegend=False,
+        )
+    return fig_dist
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_strategy_fig(ages, occs, strat_view):
+    """Strategy-effectiveness chart in either average or box-plot view."""
+    if strat_view == "Average (easier)":
+        mean_effect = compute_strategy_stats(ages, occs).sort_values(
+            "mean", ascending=True
+        )
+        means = mean_effect["mean"].to_numpy()
+        fig_strat = go.Figure(
+            go.Bar(
+                x=means,
+                y=mean_effect["Cleaned Strategies"].to_numpy(),
+                orientation="h",
+                text=np.round(means, 2),
+                textposition="outside",
+                marker=dict(color=means, colorscale="Tealgrn"),
+                customdata=mean_effect[["count"]].to_numpy(),
+                hovertemplate="<b>%{y}</b><br>Avg: %{x:.2f} / 5<br>N: %{customdata[0]}<extra></extra>",
+            )
+        )
+        fig_strat.update_layout(
+            title="Average Effectiveness of Coping Strategies",
+            xaxis=dict(title="Average Effectiveness (1-5)", range=[0, 5]),
+            yaxis_title=None,
+        )
+    else:
+        strategy_data = compute_strategy_frame(ages, occs)
+        summaries = []
+        for name, vals in strategy_data.groupby(
+            "Cleaned Strategies", observed=True
+        )["Strategy Affectiveness"]:
+            v = vals.to_numpy()
+            if len(v):
+                summaries.append((v.sum(), name, *box_summary(v)))
+        # Sort by total ascending, matching the old categoryorder setting
+        summaries.sort()
+        _, names, q1s, medians, q3s, lowers, uppers = zip(*summaries)
+        fig_strat = go.Figure(
+            go.Box(
+                y=names,
+                q1=q1s,
+                median=medians,
+                q3=q3s,
+                lowerfence=lowers,
+                upperfence=uppers,
+                orientation="h",
+                marker_color="#20B2AA",
+            )
+        )
+        fig_strat.update_layout(
+            title="Effectiveness of Different Coping Strategies",
+            showlegend=False,
+            yaxis_title=None,
+            xaxis_title="Self-Rated Effectiveness (1-5)",
+        )
+    return fig_strat
+
+
+# Static footer markup; built once at import so reruns just emit the
+# constant instead of re-allocating the template literal
+_FOOTER_HTML = """
+<div style="
+    background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+    padding: 30px;
+    border-radius: 15px;
+    margin-top: 40px;
+    text-align: center;
+    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+">
+    <h3 style="color: white; margin: 0 0 15px 0;">🎯 Take Action Today</h3>
+    <p style="color: rgba(255,255,255,0.8); margin: 0 0 20px 0; font-size: 1.1em;">
+        Use these insights to improve your digital wellness and focus habits
+    </p>
+    <div style="
+        display: flex;
+        justify-content: center;
+        gap: 20px;
+        flex-wrap: wrap;
+    ">
+        <div style="
+            background: rgba(255,255,255,0.1);
+            padding: 15px;
+            border-radius: 10px;
+            min-width: 200px;
+        ">
+            <h4 style="color: #74b9ff; margin: 0 0 10px 0;">📱 Set Limits</h4>
+            <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
+                Use app timers and screen time limits
+            </p>
+        </div>
+        <div style="
+            background: rgba(255,255,255,0.1);
+            padding: 15px;
+            border-radius: 10px;
+            min-width: 200px;
+        ">
+            <h4 style="color: #00b894; margin: 0 0 10px 0;">🧘 Practice Mindfulness</h4>
+            <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
+                Take regular breaks and practice focus techniques
+            </p>
+        </div>
+        <div style="
+            background: rgba(255,255,255,0.1);
+            padding: 15px;
+            border-radius: 10px;
+            min-width: 200px;
+        ">
+            <h4 style="color: #fdcb6e; margin: 0 0 10px 0;">⚖️ Find Balance</h4>
+            <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
+                Balance online and offline activities
+            </p>
+        </div>
+    </div>
+    <p style="color: rgba(255,255,255,0.6); margin: 20px 0 0 0; font-size: 0.8em;">
+        🧠 Digital Behavior & Focus Dashboard | Built with Streamlit & ❤️
+    </p>
+</div>
+"""
+
+
 # --- Main Application ---
 def main():
     # Load data
-    df = load_and_clean_data("survey.csv")
-    if df is None:
+    loaded = load_and_clean_data(DATA_FILE)
+    if loaded is None:
         st.error("Error: The data file 'survey.csv' was not found.")
         st.info(
             "Please make sure the data file is in the same folder as your Streamlit app script."
         )
         return
+    df, _, _ = loaded
 
     # --- Simple Sidebar for Filters ---
     with st.sidebar:
@@ -237,9 +907,10 @@ def main():
         # Simple filter sections
         st.markdown("### 🎯 Filter Options")
         
+        age_options, occupation_options = get_filter_options()
+
         # Age Group Filter
         st.markdown("**Age Groups:**")
-        age_options = sorted(df["Age Group"].unique().tolist())
         selected_ages = st.multiselect(
             "Choose age groups to analyze",
             age_options, 
@@ -251,7 +922,6 @@ def main():
 
         # Occupation Filter
         st.markdown("**Occupations:**")
-        occupation_options = sorted(df["Occupation"].unique().tolist())
         selected_occupations = st.multiselect(
             "Choose occupations to analyze",
             occupation_options, 
@@ -273,11 +943,12 @@ def main():
         st.metric("📈 Total Respondents", total_respondents)
         
         # Show filtered count
-        filtered_df = df[
-            df["Age Group"].isin(selected_ages)
-            & df["Occupation"].isin(selected_occupations)
-        ]
-        
+        filter_key = (
+            tuple(sorted(selected_ages)),
+            tuple(sorted(selected_occupations)),
+        )
+        filtered_df = compute_filtered(*filter_key)
+
         filtered_count = filtered_df.shape[0]
         percentage = (filtered_count / total_respondents * 100) if total_respondents > 0 else 0
         
@@ -308,10 +979,8 @@ def main():
         )
         return
 
-    filtered_df = df[
-        df["Age Group"].isin(selected_ages)
-        & df["Occupation"].isin(selected_occupations)
-    ]
+    # filtered_df was already computed once for the sidebar quick stats;
+    # reuse it instead of filtering again
 
     # --- Main Panel ---
     # Create a simple but beautiful header
@@ -347,15 +1016,11 @@ def main():
     # --- KPI Metrics with Simple Styling ---
     st.markdown("## 📊 Key Performance Indicators")
     
-    total_respondents = filtered_df.shape[0]
-    avg_attention = (
-        round(filtered_df["Attention Rating"].mean(), 1) if not filtered_df.empty else 0
-    )
-    avg_distraction = (
-        round(filtered_df["Distraction Rating"].mean(), 1)
-        if not filtered_df.empty
-        else 0
-    )
+    # KPI values come from the cached per-filter summary, not the raw rows
+    stats = summarize(*filter_key)
+    total_respondents = stats.n
+    avg_attention = round(stats.att_mean, 1) if stats.n else 0
+    avg_distraction = round(stats.dist_mean, 1) if stats.n else 0
 
     # Simple KPI layout
     kpi1, kpi2, kpi3 = st.columns(3)
@@ -386,9 +1051,9 @@ def main():
     # Simple KPI Insights
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown(f'<div class="insight-box">{get_attention_insight(filtered_df)}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="insight-box">{get_attention_insight(stats)}</div>', unsafe_allow_html=True)
     with col2:
-        st.markdown(f'<div class="insight-box">{get_distraction_insight(filtered_df)}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="insight-box">{get_distraction_insight(stats)}</div>', unsafe_allow_html=True)
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -413,29 +1078,9 @@ def main():
             col1, col2 = st.columns(2)
 
             with col1:
-                age_counts = filtered_df["Age Group"].value_counts()
-                fig_age = px.pie(
-                    names=age_counts.index,
-                    values=age_counts.values,
-                    title="Age Group Distribution",
-                    color_discrete_sequence=px.colors.qualitative.Set3,
-                )
-                fig_age.update_traces(
-                    hovertemplate="<b>Age Group:</b> %{label}<br><b>Respondents:</b> %{value}<br><b>Percentage:</b> %{percent}<extra></extra>",
-                    textinfo='label+percent',
-                    textfont_size=12,
-                    marker=dict(line=dict(color='white', width=2))
-                )
-                fig_age.update_layout(
-                    showlegend=False,
-                    title_font_size=18,
-                    title_font_color="#2c3e50",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    margin=dict(t=50, b=50, l=50, r=50)
-                )
-                st.plotly_chart(fig_age, use_container_width=True)
-                
+                age_counts = stats.age_counts
+                st.plotly_chart(build_age_pie(*filter_key), use_container_width=True)
+
                 # Age insights
                 dominant_age = age_counts.idxmax()
                 dominant_count = age_counts.max()
@@ -445,22 +1090,11 @@ def main():
                 )
 
             with col2:
-                occupation_counts = filtered_df["Occupation"].value_counts()
-                fig_occ = px.bar(
-                    x=occupation_counts.values,
-                    y=occupation_counts.index,
-                    orientation="h",
-                    title="Occupation Distribution",
-                    labels={"x": "Number of Respondents", "y": ""},
-                    color=occupation_counts.values,
-                    color_continuous_scale=px.colors.sequential.Blues_r,
+                occupation_counts = stats.occ_counts
+                st.plotly_chart(
+                    build_occupation_bar(*filter_key), use_container_width=True
                 )
-                fig_occ.update_layout(
-                    yaxis={"categoryorder": "total ascending"},
-                    coloraxis_showscale=False,
-                )
-                st.plotly_chart(fig_occ, use_container_width=True)
-                
+
                 # Occupation insights
                 dominant_occ = occupation_counts.idxmax()
                 dominant_occ_count = occupation_counts.max()
@@ -487,41 +1121,12 @@ def main():
             st.info("No data available for the selected filters.")
         else:
             # Platform usage analysis
-            platform_column = "Platforms used"
-            platforms = filtered_df[platform_column].dropna().str.split(", ")
-            platform_counts = Counter(
-                item.strip() for sublist in platforms for item in sublist
-            )
-            platform_df = pd.DataFrame(
-                platform_counts.items(), columns=["Platform", "Count"]
-            ).sort_values("Count", ascending=True)
-            platform_df = platform_df[
-                ~platform_df["Platform"].str.contains("etc.", na=False)
-            ]
+            st.plotly_chart(build_platform_fig(*filter_key), use_container_width=True)
 
-            fig_plat = px.bar(
-                platform_df,
-                x="Count",
-                y="Platform",
-                orientation="h",
-                title="Most Commonly Used Digital Platforms",
-                color="Count",
-                color_continuous_scale=px.colors.sequential.Tealgrn_r,
-            )
-            fig_plat.update_layout(coloraxis_showscale=False, yaxis_title=None)
-            st.plotly_chart(fig_plat, use_container_width=True)
-            
             # Platform insight
-            st.caption(get_platform_insight(platform_counts))
+            st.caption(get_platform_insight(compute_platform_counts(*filter_key)))
 
             # Screen time vs distraction analysis
-            screen_time_order = [
-                "Less than 3 hours",
-                "3–5 hours",
-                "6–8 hours",
-                "9+ hours",
-            ]
-
             # New: Toggle between 'Box plot (distribution)' and 'Average bar chart'
             view_type = st.radio(
                 "Chart view",
@@ -532,54 +1137,20 @@ def main():
                 key="screen_time_view",
             )
 
-            if view_type == "Average (easier)":
-                avg_by_time = (
-                    filtered_df.groupby("Screen TIme")["Distraction Rating"].mean().reindex(screen_time_order)
-                )
-                count_by_time = (
-                    filtered_df.groupby("Screen TIme")["Distraction Rating"].count().reindex(screen_time_order)
-                )
-                avg_df = (
-                    pd.DataFrame({"Screen TIme": avg_by_time.index, "Avg Distraction": avg_by_time.values, "N": count_by_time.values})
-                    .dropna()
-                )
-                fig_dist = px.bar(
-                    avg_df,
-                    x="Screen TIme",
-                    y="Avg Distraction",
-                    color="Avg Distraction",
-                    color_continuous_scale=px.colors.sequential.OrRd,
-                    text=avg_df["Avg Distraction"].round(2),
-                    title="Average Distraction Rating by Daily Screen Time",
-                    category_orders={"Screen TIme": screen_time_order},
-                    labels={"Screen TIme": "Screen Time", "Avg Distraction": "Average Distraction (1-5)"},
-                )
-                fig_dist.update_traces(textposition="outside", hovertemplate="<b>%{x}</b><br>Avg: %{y:.2f} / 5<br>N: %{customdata[0]}<extra></extra>", customdata=avg_df[["N"]])
-                fig_dist.update_layout(yaxis_range=[0,5], coloraxis_showscale=False)
-                st.plotly_chart(fig_dist, use_container_width=True)
-            else:
-                fig_dist = px.box(
-                    filtered_df,
-                    x="Screen TIme",
-                    y="Distraction Rating",
-                    title="Self-Rated Distraction by Daily Screen Time",
-                    category_orders={"Screen TIme": screen_time_order},
-                    labels={"Screen TIme": "Screen Time", "Distraction Rating": "Distraction Rating (1-5)"},
-                )
-                fig_dist.update_traces(
-                    hovertemplate="<b>Screen Time:</b> %{x}<br><b>Distraction Rating:</b> %{y}<extra></extra>",
-                    marker_color="#FF6347",
-                )
-                fig_dist.update_layout(showlegend=False)
-                st.plotly_chart(fig_dist, use_container_width=True)
-            
+            st.plotly_chart(
+                build_screen_time_fig(*filter_key, view_type),
+                use_container_width=True,
+            )
+
             # Screen time insight (aligned to selected view)
-            st.caption(get_screen_time_insight(filtered_df))
+            st.caption(get_screen_time_insight(stats))
 
             # Trend analysis based on averages for clarity
-            screen_time_distraction = filtered_df.groupby("Screen TIme")["Distraction Rating"].mean()
+            screen_time_stats = compute_screen_time_stats(*filter_key).reindex(
+                SCREEN_TIME_ORDER
+            )
+            screen_time_distraction = screen_time_stats["mean"].dropna()
             if len(screen_time_distraction) > 1:
-                screen_time_distraction = screen_time_distraction.reindex(screen_time_order).dropna()
                 highest_distraction_time = screen_time_distraction.idxmax()
                 highest_distraction_value = screen_time_distraction.max()
                 st.markdown(f'<div class="trend-highlight">'
@@ -599,27 +1170,9 @@ def main():
         if filtered_df.empty:
             st.info("No data available for the selected filters.")
         else:
-            strategy_col = "Cleaned Strategies"
-            effectiveness_col = "Strategy Affectiveness"
-            strategy_data = filtered_df[[strategy_col, effectiveness_col]].dropna()
+            strategy_data = compute_strategy_frame(*filter_key)
 
             if not strategy_data.empty:
-                strategy_data = strategy_data.assign(
-                    **{strategy_col: strategy_data[strategy_col].str.split(", ")}
-                ).explode(strategy_col)
-                strategy_data[strategy_col] = strategy_data[strategy_col].str.strip()
-                unwanted_strategies = [
-                    "Na",
-                    "which is often on-screen",
-                    "recenter on chosen task",
-                ]
-                strategy_data = strategy_data[
-                    ~strategy_data[strategy_col].isin(unwanted_strategies)
-                ]
-                strategy_data = strategy_data[
-                    strategy_data[strategy_col].str.len() < 35
-                ]
-
                 # New: toggle for easier average view vs distribution
                 strat_view = st.radio(
                     "Chart view",
@@ -630,52 +1183,21 @@ def main():
                     key="strategy_view",
                 )
 
-                if strat_view == "Average (easier)":
-                    mean_effect = (
-                        strategy_data.groupby("Cleaned Strategies")["Strategy Affectiveness"].agg(["mean", "count"]).reset_index()
-                    )
-                    mean_effect = mean_effect.sort_values("mean", ascending=True)
-                    fig_strat = px.bar(
-                        mean_effect,
-                        x="mean",
-                        y="Cleaned Strategies",
-                        orientation="h",
-                        text=mean_effect["mean"].round(2),
-                        color="mean",
-                        color_continuous_scale=px.colors.sequential.Tealgrn,
-                        labels={"mean": "Average Effectiveness (1-5)", "Cleaned Strategies": ""},
-                        title="Average Effectiveness of Coping Strategies",
-                    )
-                    fig_strat.update_traces(textposition="outside", hovertemplate="<b>%{y}</b><br>Avg: %{x:.2f} / 5<br>N: %{customdata[0]}<extra></extra>", customdata=mean_effect[["count"]])
-                    fig_strat.update_layout(coloraxis_showscale=False, xaxis_range=[0,5])
-                    st.plotly_chart(fig_strat, use_container_width=True)
-                else:
-                    fig_strat = px.box(
-                        strategy_data,
-                        x="Strategy Affectiveness",
-                        y="Cleaned Strategies",
-                        title="Effectiveness of Different Coping Strategies",
-                    )
-                    fig_strat.update_traces(
-                        hovertemplate="<b>Strategy:</b> %{y}<br><b>Effectiveness:</b> %{x}<extra></extra>",
-                        marker_color="#20B2AA",
-                    )
-                    fig_strat.update_layout(
-                        showlegend=False,
-                        yaxis={"categoryorder": "total ascending"},
-                        yaxis_title=None,
-                        xaxis_title="Self-Rated Effectiveness (1-5)",
-                    )
-                    st.plotly_chart(fig_strat, use_container_width=True)
+                strategy_stats = compute_strategy_stats(*filter_key)
+
+                st.plotly_chart(
+                    build_strategy_fig(*filter_key, strat_view),
+                    use_container_width=True,
+                )
 
                 # Strategy insight (no emoji)
-                st.caption(get_strategy_insight(strategy_data))
+                st.caption(get_strategy_insight(strategy_stats))
 
                 # Most effective strategy recommendation (no emoji)
-                strategy_effectiveness = strategy_data.groupby("Cleaned Strategies")["Strategy Affectiveness"].mean()
-                if not strategy_effectiveness.empty:
-                    best_strategy = strategy_effectiveness.idxmax()
-                    best_rating = strategy_effectiveness.max()
+                if not strategy_stats.empty:
+                    best_row = strategy_stats.loc[strategy_stats["mean"].idxmax()]
+                    best_strategy = best_row["Cleaned Strategies"]
+                    best_rating = best_row["mean"]
                     st.markdown(f'<div class="trend-highlight">'
                                f'<b>Top recommendation:</b> "{best_strategy}" is rated most effective '
                                f'({best_rating:.1f}/5) among your selected group.'
@@ -699,25 +1221,12 @@ def main():
                 "This helps identify common themes in how people perceive their tech relationship."
             )
 
-            nlp_column = "Tech Relationship"
-            text_data = " ".join(
-                str(feedback) for feedback in filtered_df[nlp_column].dropna()
-            )
+            tech_freqs = compute_tech_freqs(*filter_key)
+
+            if tech_freqs:
+                st.image(render_wordcloud(tech_freqs), use_container_width=True)
+
 
-            if text_data.strip():
-                wordcloud = WordCloud(
-                    width=1200,
-                    height=600,
-                    background_color="#FFFFFF",
-                    colormap="plasma",
-                    collocations=False,
-                ).generate(text_data)
-
-                fig_wc, ax = plt.subplots(figsize=(12, 6))
-                ax.imshow(wordcloud, interpolation="bilinear")
-                ax.axis("off")
-                st.pyplot(fig_wc)
-                
                 # Word cloud insights
                 st.caption(
                     "Sentiment note: The word cloud reveals common themes in how people describe "
@@ -747,197 +1256,92 @@ def main():
                 st.metric("Total Respondents Analyzed", total_respondents)
                 
                 # Screen time distribution
-                screen_time_dist = filtered_df["Screen TIme"].value_counts()
-                most_common_screen_time = screen_time_dist.idxmax()
+                most_common_screen_time = stats.screen_counts.idxmax()
                 st.metric("Most Common Screen Time", most_common_screen_time)
-            
+
             with col2:
                 st.subheader("Demographics Summary")
-                age_dist = filtered_df["Age Group"].value_counts()
-                dominant_age_group = age_dist.idxmax()
+                dominant_age_group = stats.age_counts.idxmax()
                 st.metric("Dominant Age Group", dominant_age_group)
-                
-                occ_dist = filtered_df["Occupation"].value_counts()
-                dominant_occupation = occ_dist.idxmax()
+
+                dominant_occupation = stats.occ_counts.idxmax()
                 st.metric("Dominant Occupation", dominant_occupation)
-                
+
                 # Focus duration
-                focus_dist = filtered_df["Focus Duration"].value_counts()
-                most_common_focus = focus_dist.idxmax()
+                most_common_focus = stats.focus_counts.idxmax()
                 st.metric("Most Common Focus Duration", most_common_focus)
             
             # Key insights summary
             st.subheader("Key Insights")
 
-            # Correlation and relationships
-            # Encode screen time as ordinal for simple correlation
-            screen_time_map = {
-                "Less than 3 hours": 1,
-                "3–5 hours": 2,
-                "6–8 hours": 3,
-                "9+ hours": 4,
-            }
-            df_corr = filtered_df.copy()
-            df_corr = df_corr[df_corr["Screen TIme"].isin(screen_time_map.keys())]
-            df_corr["screen_time_num"] = df_corr["Screen TIme"].map(screen_time_map)
-
-            corr_distraction = None
-            corr_attention = None
-            if not df_corr.empty:
-                try:
-                    corr_distraction = df_corr[["screen_time_num", "Distraction Rating"]].corr().iloc[0,1]
-                    corr_attention = df_corr[["screen_time_num", "Attention Rating"]].corr().iloc[0,1]
-                except Exception:
-                    pass
-
-            if corr_distraction is not None:
-                st.caption(f"Correlation (screen time vs distraction): {corr_distraction:.2f} (positive means more screen time, more distraction)")
-            if corr_attention is not None:
-                st.caption(f"Correlation (screen time vs attention): {corr_attention:.2f} (negative means more screen time, less attention)")
+            # All derived values are computed once per filter selection
+            insights = compute_insights(*filter_key)
+
+            if stats.n < MIN_INSIGHT_ROWS:
+                st.info(
+                    f"Fewer than {MIN_INSIGHT_ROWS} responses match the current "
+                    "filters, so correlation and strategy insights are hidden."
+                )
+
+            if insights.corr_distraction is not None:
+                st.caption(f"Correlation (screen time vs distraction): {insights.corr_distraction:.2f} (positive means more screen time, more distraction)")
+            if insights.corr_attention is not None:
+                st.caption(f"Correlation (screen time vs attention): {insights.corr_attention:.2f} (negative means more screen time, less attention)")
 
             # Insight 1: Attention vs Distraction
             attention_distraction_ratio = avg_attention / avg_distraction if avg_distraction > 0 else 0
-            if attention_distraction_ratio > 1.2:
-                insight1 = "Positive focus balance: Attention rating exceeds distraction rating, indicating good digital wellness."
-            elif attention_distraction_ratio > 0.8:
-                insight1 = "Moderate focus challenge: Attention and distraction are closely balanced, suggesting room for improvement."
-            else:
-                insight1 = "Focus challenge: Distraction rating exceeds attention rating, indicating significant digital wellness concerns."
-            st.markdown(f'<div class="insight-box">{insight1}</div>', unsafe_allow_html=True)
+            # The two threshold tests index straight into the verdict tuple
+            insight1 = FOCUS_BALANCE_INSIGHTS[
+                int(attention_distraction_ratio > 0.8)
+                + int(attention_distraction_ratio > 1.2)
+            ]
+            insight_boxes = [insight1]
 
             # Insight 2: Screen time impact (averages)
-            high_screen_time = filtered_df[filtered_df["Screen TIme"] == "9+ hours"]
-            if not high_screen_time.empty:
-                high_screen_distraction = high_screen_time["Distraction Rating"].mean()
+            if insights.high_screen_distraction is not None:
+                high_screen_distraction = insights.high_screen_distraction
                 if high_screen_distraction > 3:
-                    insight2 = f"Screen Time Impact: Users with 9+ hours screen time report high distraction ({high_screen_distraction:.1f}/5), suggesting excessive usage affects focus."
+                    insight_boxes.append(f"Screen Time Impact: Users with 9+ hours screen time report high distraction ({high_screen_distraction:.1f}/5), suggesting excessive usage affects focus.")
                 else:
-                    insight2 = f"Screen Time Management: Users with 9+ hours screen time manage distraction well ({high_screen_distraction:.1f}/5), indicating effective coping strategies."
-                st.markdown(f'<div class="insight-box">{insight2}</div>', unsafe_allow_html=True)
+                    insight_boxes.append(f"Screen Time Management: Users with 9+ hours screen time manage distraction well ({high_screen_distraction:.1f}/5), indicating effective coping strategies.")
+
+            # One markdown emit for the whole group: each st.markdown call is
+            # a separate frontend delta, so batching halves the message count
+            st.markdown(
+                "".join(f'<div class="insight-box">{x}</div>' for x in insight_boxes),
+                unsafe_allow_html=True,
+            )
 
             # Emotional well-being snapshot
             st.subheader("Emotional Well-being Snapshot")
-            # Use 'Digital Guilt' and 'Emotional Impact' if available
-            guilt_col = "Digital Guilt"
-            impact_col = "Emotional Impact"
-            if guilt_col in filtered_df.columns:
-                guilt_counts = filtered_df[guilt_col].value_counts(dropna=True).to_dict()
-                top_guilt = max(guilt_counts, key=guilt_counts.get) if guilt_counts else None
-                if top_guilt is not None:
-                    st.caption(f"Most common digital guilt frequency: {top_guilt}")
-            if impact_col in filtered_df.columns:
-                impact_counts = filtered_df[impact_col].value_counts(dropna=True).to_dict()
-                top_impact = max(impact_counts, key=impact_counts.get) if impact_counts else None
-                if top_impact is not None:
-                    st.caption(f"Most cited emotional impacts: {top_impact}")
+            if insights.top_guilt is not None:
+                st.caption(f"Most common digital guilt frequency: {insights.top_guilt}")
+            if insights.top_impact is not None:
+                st.caption(f"Most cited emotional impacts: {insights.top_impact}")
 
             # Insight 3: Strategy effectiveness
-            strategy_data = filtered_df[["Cleaned Strategies", "Strategy Affectiveness"]].dropna()
-            if not strategy_data.empty:
-                strategy_data = strategy_data.assign(
-                    **{"Cleaned Strategies": strategy_data["Cleaned Strategies"].str.split(", ")}
-                ).explode("Cleaned Strategies")
-                strategy_data["Cleaned Strategies"] = strategy_data["Cleaned Strategies"].str.strip()
-                strategy_effectiveness = strategy_data.groupby("Cleaned Strategies")["Strategy Affectiveness"].mean()
-                if not strategy_effectiveness.empty:
-                    best_strategy = strategy_effectiveness.idxmax()
-                    best_rating = strategy_effectiveness.max()
-                    insight3 = f"Best Strategy: '{best_strategy}' is most effective ({best_rating:.1f}/5) for this group."
-                    st.markdown(f'<div class="insight-box">{insight3}</div>', unsafe_allow_html=True)
+            if insights.best_strategy is not None:
+                insight3 = f"Best Strategy: '{insights.best_strategy}' is most effective ({insights.best_rating:.1f}/5) for this group."
+                st.markdown(f'<div class="insight-box">{insight3}</div>', unsafe_allow_html=True)
             
             # Recommendations
             st.subheader("Recommendations")
             
+            # Collect the applicable blocks and emit them in one call, for
+            # the same reason as the insight boxes above
+            recommendations = []
             if avg_distraction > 3:
-                st.markdown("""
-                **For High Distraction Groups:**
-                - Implement app timers and screen time limits
-                - Try Pomodoro technique for focused work sessions
-                - Consider digital detox periods
-                - Use Do Not Disturb mode during important tasks
-                """)
-            
+                recommendations.append(HIGH_DISTRACTION_TIPS)
+
             if avg_attention < 3:
-                st.markdown("""
-                **For Low Attention Groups:**
-                - Practice mindfulness and meditation
-                - Create distraction-free work environments
-                - Set clear goals and time boundaries
-                - Use focus-enhancing tools and techniques
-                """)
-            
-            st.markdown("""
-            **General Digital Wellness Tips:**
-            - Take regular breaks from screens
-            - Set specific times for checking social media
-            - Use technology intentionally rather than habitually
-            - Balance online and offline activities
-            - Monitor and reflect on digital habits regularly
-            """)
+                recommendations.append(LOW_ATTENTION_TIPS)
+
+            recommendations.append(GENERAL_WELLNESS_TIPS)
+            st.markdown("\n".join(recommendations))
 
     # --- Beautiful Footer ---
     st.markdown("---")
-    st.markdown(
-        """
-        <div style="
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-            padding: 30px;
-            border-radius: 15px;
-            margin-top: 40px;
-            text-align: center;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        ">
-            <h3 style="color: white; margin: 0 0 15px 0;">🎯 Take Action Today</h3>
-            <p style="color: rgba(255,255,255,0.8); margin: 0 0 20px 0; font-size: 1.1em;">
-                Use these insights to improve your digital wellness and focus habits
-            </p>
-            <div style="
-                display: flex;
-                justify-content: center;
-                gap: 20px;
-                flex-wrap: wrap;
-            ">
-                <div style="
-                    background: rgba(255,255,255,0.1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    min-width: 200px;
-                ">
-                    <h4 style="color: #74b9ff; margin: 0 0 10px 0;">📱 Set Limits</h4>
-                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
-                        Use app timers and screen time limits
-                    </p>
-                </div>
-                <div style="
-                    background: rgba(255,255,255,0.1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    min-width: 200px;
-                ">
-                    <h4 style="color: #00b894; margin: 0 0 10px 0;">🧘 Practice Mindfulness</h4>
-                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
-                        Take regular breaks and practice focus techniques
-                    </p>
-                </div>
-                <div style="
-                    background: rgba(255,255,255,0.1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    min-width: 200px;
-                ">
-                    <h4 style="color: #fdcb6e; margin: 0 0 10px 0;">⚖️ Find Balance</h4>
-                    <p style="color: rgba(255,255,255,0.8); margin: 0; font-size: 0.9em;">
-                        Balance online and offline activities
-                    </p>
-                </div>
-            </div>
-            <p style="color: rgba(255,255,255,0.6); margin: 20px 0 0 0; font-size: 0.8em;">
-                🧠 Digital Behavior & Focus Dashboard | Built with Streamlit & ❤️
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""One-shot build script: convert survey.csv into typed Parquet artifacts.
+
+Run from the repository root:
+
+    python tools/make_parquet.py
+
+This applies the full cleaning pipeline offline — column selection and
+renaming, the occupation fixes, Categorical conversion, numeric
+downcasts, the pre-aggregated cube, the exploded strategy table, and the
+tech-relationship tokens — and writes one Parquet file per artifact.
+When these files exist the app's loader is reduced to three plain
+read_parquet calls.
+"""
+
+import pandas as pd
+
+CSV_FILE = "survey.csv"
+PARQUET_FILE = "survey.parquet"
+CUBE_FILE = "cube.parquet"
+STRATEGIES_FILE = "strategies_long.parquet"
+
+# Keep these in sync with the CSV fallback path in app.py
+USECOLS = [
+    "Age Group",
+    "Occupation",
+    "Screen TIme",
+    "Platforms used",
+    "Focus Duration",
+    "Attention Rating",
+    "Distraction Rating",
+    "Digital Guilt",
+    "Emotional Impact",
+    "Cleaned Strategies",
+    "Strategy Affectiveness",
+    "Tech Relationship",
+]
+
+OCCUPATION_MAPPING = {
+    "Working Profesional": "Working Professional",  # Correcting typo
+    "Working Profesional, Freelancer / Self-Employed": "Hybrid Professional",
+    "Student, Freelancer / Self-Employed": "Student & Freelancer",
+}
+
+CATEGORY_COLUMNS = ["Age Group", "Occupation", "Screen TIme", "Focus Duration"]
+
+UNWANTED_STRATEGIES = [
+    "Na",
+    "which is often on-screen",
+    "recenter on chosen task",
+]
+
+
+def build(csv_path=CSV_FILE):
+    df = pd.read_csv(csv_path, usecols=lambda c: c.strip() in USECOLS)
+    df.columns = df.columns.str.strip()
+    df["Occupation"] = df["Occupation"].replace(OCCUPATION_MAPPING)
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    for col in ["Attention Rating", "Distraction Rating"]:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    df["Strategy Affectiveness"] = pd.to_numeric(
+        df["Strategy Affectiveness"], downcast="float"
+    )
+
+    cube = df.groupby(
+        ["Age Group", "Occupation", "Screen TIme"], observed=True
+    ).agg(
+        n=("Attention Rating", "size"),
+        att_sum=("Attention Rating", "sum"),
+        dist_sum=("Distraction Rating", "sum"),
+    )
+
+    strategy_col = "Cleaned Strategies"
+    strategies_long = df[[strategy_col, "Strategy Affectiveness"]].dropna()
+    # pyarrow is already required for the Parquet output, so the Arrow string
+    # kernels are always available here
+    strategies_long[strategy_col] = strategies_long[strategy_col].astype(
+        "string[pyarrow]"
+    )
+    strategies_long = strategies_long.assign(
+        **{
+            strategy_col: strategies_long[strategy_col]
+            .str.strip()
+            .str.split(r"\s*,\s*", regex=True)
+        }
+    ).explode(strategy_col)
+    strategies_long = strategies_long[
+        ~strategies_long[strategy_col].isin(UNWANTED_STRATEGIES)
+    ]
+    strategies_long = strategies_long[strategies_long[strategy_col].str.len() < 35]
+    strategies_long[strategy_col] = strategies_long[strategy_col].astype("category")
+
+    df["_tech_tokens"] = (
+        df["Tech Relationship"].fillna("").str.lower().str.findall(r"[a-z']{3,}")
+    )
+
+    df.to_parquet(PARQUET_FILE, compression="zstd")
+    cube.to_parquet(CUBE_FILE, compression="zstd")
+    strategies_long.to_parquet(STRATEGIES_FILE, compression="zstd")
+    print(f"Wrote {PARQUET_FILE} ({len(df)} rows)")
+    print(f"Wrote {CUBE_FILE} ({len(cube)} groups)")
+    print(f"Wrote {STRATEGIES_FILE} ({len(strategies_long)} rows)")
+
+
+if __name__ == "__main__":
+    build()